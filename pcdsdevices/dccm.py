@@ -1,4 +1,5 @@
 import logging
+import math
 import time
 import typing
 from collections import namedtuple
@@ -25,6 +26,10 @@ logger = logging.getLogger(__name__)
 
 # conversion factor between photon energy and wavelength
 eV_to_lambda = physical_constants["joule-electron volt relationship"][0] * c * h / angstrom
+keV_to_lambda = eV_to_lambda / 1000
+# angle unit conversions, kept as single multiplies in the scalar paths
+_deg_to_rad = math.pi / 180
+_rad_to_deg = 180 / math.pi
 
 
 class CrystalIndex(float, Enum):
@@ -143,7 +148,6 @@ class DCCMEnergy(FltMvInterface, PseudoPositioner):
         PseudoPositioner interface function for calculating the setpoint.
         Converts the requested energy to theta 1 and theta 2 (Bragg angle).
         """
-        pseudo_pos = self.PseudoPosition(*pseudo_pos)
         energy = pseudo_pos.energy
         theta = self.energyToBraggAngle(energy)
         return self.RealPosition(th1=theta, th2=theta)
@@ -155,7 +159,6 @@ class DCCMEnergy(FltMvInterface, PseudoPositioner):
 
         Converts the real position of the DCCM theta motor to the calculated energy.
         """
-        real_pos = self.RealPosition(*real_pos)
         theta = real_pos.th1
         if theta < 0.1:
             energy = float('NaN')
@@ -163,40 +166,58 @@ class DCCMEnergy(FltMvInterface, PseudoPositioner):
             energy = self.braggAngleToEnergy(theta)
         return self.PseudoPosition(energy=energy)
 
-    def energyToBraggAngle(self, energy: float) -> float:
+    def energyToBraggAngle(
+        self,
+        energy: typing.Union[float, np.ndarray],
+        out: typing.Optional[np.ndarray] = None,
+    ) -> typing.Union[float, np.ndarray]:
         """
         Converts energy to Bragg angle theta
 
+        Arrays are converted in a single vectorized pass, which is much
+        faster than looping over this method when building energy scan
+        tables.
+
         Parameters
         ----------
-        energy : float
+        energy : float or np.ndarray
             The photon energy (color) in keV.
+        out : np.ndarray, optional
+            Preallocated float64 array to write array results into, e.g.
+            to reuse one buffer across the steps of a scan. Ignored for
+            scalar inputs.
 
         Returns
         ---------
-        Bragg angle: float
+        Bragg angle: float or np.ndarray
             The angle in degrees
         """
-        energy = energy * 1000
-        bragg_angle = np.rad2deg(np.arcsin(np.float64(eV_to_lambda)/energy/(2*self.dspacing)))
-        return bragg_angle
+        return energy_to_bragg_angle(energy, self.dspacing, out=out)
 
-    def braggAngleToEnergy(self, theta):
+    def braggAngleToEnergy(
+        self,
+        theta: typing.Union[float, np.ndarray],
+        out: typing.Optional[np.ndarray] = None,
+    ) -> typing.Union[float, np.ndarray]:
         """
         Converts dccm theta angle to energy.
 
+        Arrays are converted in a single vectorized pass.
+
         Parameters
         ----------
-        energy : float
+        theta : float or np.ndarray
             The Bragg angle theta in degrees
+        out : np.ndarray, optional
+            Preallocated float64 array to write array results into.
+            Ignored for scalar inputs.
 
         Returns:
         ----------
-        energy: float
+        energy: float or np.ndarray
              The photon energy (color) in keV.
         """
-        energy = eV_to_lambda/(2*self.dspacing*np.sin(np.deg2rad(np.float64(theta))))
-        return energy/1000
+        return bragg_angle_to_energy(theta, self.dspacing, out=out)
 
 
 class DCCMEnergyWithVernier(DCCMEnergy):
@@ -256,7 +277,6 @@ class DCCMEnergyWithVernier(DCCMEnergy):
         PseudoPositioner interface function for calculating the setpoint.
         Converts the requested energy to theta 1 and theta 2 (Bragg angle).
         """
-        pseudo_pos = self.PseudoPosition(*pseudo_pos)
         energy = pseudo_pos.energy
         theta = self.energyToBraggAngle(energy)
         vernier = energy * 1000
@@ -380,3 +400,52 @@ class DCCM(BaseInterface, GroupDevice):
         self.acr_status_suffix = acr_status_suffix
         self.acr_status_pv_index = acr_status_pv_index
         super().__init__(prefix, **kwargs)
+
+
+# Calculations between photon energy and Bragg angle.
+# These accept either floats or numpy arrays: floats (and 0-d arrays) go
+# through the math module to skip the ufunc overhead, arrays are converted
+# in one pass, optionally into a caller-owned out buffer. Inputs with no
+# physical answer (zero energy or angle) give NaN either way.
+def energy_to_bragg_angle(
+    energy: typing.Union[float, np.ndarray],
+    dspacing: float,
+    out: typing.Optional[np.ndarray] = None,
+) -> typing.Union[float, np.ndarray]:
+    """Converts photon energy (keV) to Bragg angle (deg)."""
+    hc_over_2d = keV_to_lambda / (2 * dspacing)
+    if isinstance(energy, np.ndarray) and energy.ndim:
+        # Zero energies (inf here) and energies too low to be reflected by
+        # this crystal become NaN through arcsin
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bragg_angle = np.divide(
+                hc_over_2d, energy, out=out, dtype=np.float64,
+            )
+            np.arcsin(bragg_angle, out=bragg_angle)
+        return np.rad2deg(bragg_angle, out=bragg_angle)
+    if not energy:
+        return float('NaN')
+    sin_theta = hc_over_2d / energy
+    if abs(sin_theta) > 1:
+        # Energy too low to be reflected by this crystal
+        return float('NaN')
+    return math.asin(sin_theta) * _rad_to_deg
+
+
+def bragg_angle_to_energy(
+    theta: typing.Union[float, np.ndarray],
+    dspacing: float,
+    out: typing.Optional[np.ndarray] = None,
+) -> typing.Union[float, np.ndarray]:
+    """Converts Bragg angle (deg) to photon energy (keV)."""
+    hc_over_2d = keV_to_lambda / (2 * dspacing)
+    if isinstance(theta, np.ndarray) and theta.ndim:
+        energy = np.deg2rad(theta, out=out, dtype=np.float64)
+        np.sin(energy, out=energy)
+        # Zero angles have no physical energy, match the scalar NaN
+        energy[energy == 0] = np.nan
+        return np.divide(hc_over_2d, energy, out=energy)
+    sin_theta = math.sin(theta * _deg_to_rad)
+    if not sin_theta:
+        return float('NaN')
+    return hc_over_2d / sin_theta
@@ -297,3 +297,13 @@ def test_disconnected_ccm():
             y_down_prefix='Y:DOWN', y_up_north_prefix='Y:UP:NORTH',
             y_up_south_prefix='Y:UP:SOUTH', in_pos=8, out_pos=0,
             name='ccm')
+
+
+@pytest.mark.parametrize(
+    'prefix, hutch',
+    [('XPP:MON:MPZ:07A', 'XPP'),
+     ('XCS:MON:MPZ:07A', 'XCS'),
+     ('ALIO', 'TST')],
+)
+def test_guess_hutch(prefix, hutch):
+    assert ccm._guess_hutch(prefix) == hutch
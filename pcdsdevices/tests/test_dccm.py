@@ -1,9 +1,12 @@
+import warnings
 from math import isnan
 
+import numpy as np
 import pytest
 from ophyd.sim import make_fake_device
 
-from ..dccm import DCCM, CrystalIndex
+from ..dccm import (DCCM, CrystalIndex, bragg_angle_to_energy,
+                    energy_to_bragg_angle)
 from .test_epics_motor import motor_setup
 
 
@@ -43,3 +46,57 @@ def test_energy_update(fake_dccm):
     assert not isnan(fake_dccm.energy.energy.readback.get())
     assert abs(fake_dccm.energy.energy.readback.get() - 13.0022) < 0.001
     assert abs(fake_dccm.energy.forward(13).th1 - 8.7475) < 0.0001
+
+
+def test_unreachable_energy(fake_dccm):
+    motor_setup(fake_dccm.energy.th1)
+    motor_setup(fake_dccm.energy.th2)
+    fake_dccm.energy.update_crystal_index(CrystalIndex.Si333)
+    assert isnan(fake_dccm.energy.energyToBraggAngle(4))
+    assert not isnan(fake_dccm.energy.energyToBraggAngle(13))
+
+
+def test_array_conversions(fake_dccm):
+    energies = np.linspace(5, 20, 16)
+    thetas = fake_dccm.energy.energyToBraggAngle(energies)
+    assert thetas.shape == energies.shape
+    for energy, theta in zip(energies, thetas):
+        assert theta == pytest.approx(fake_dccm.energy.energyToBraggAngle(energy))
+    np.testing.assert_allclose(fake_dccm.energy.braggAngleToEnergy(thetas), energies)
+    # 0-d arrays behave like scalars
+    theta = fake_dccm.energy.energyToBraggAngle(np.array(13.0))
+    assert theta == pytest.approx(fake_dccm.energy.energyToBraggAngle(13.0))
+    assert fake_dccm.energy.braggAngleToEnergy(np.array(theta)) == pytest.approx(13.0)
+
+
+@pytest.mark.parametrize('crystal_index', list(CrystalIndex))
+def test_energy_bragg_angle_inversion(crystal_index):
+    theta = energy_to_bragg_angle(13, crystal_index.value)
+    assert bragg_angle_to_energy(theta, crystal_index.value) == pytest.approx(13)
+
+
+def test_array_conversions_out(fake_dccm):
+    energies = np.linspace(5, 20, 16)
+    buffer = np.empty_like(energies)
+    thetas = fake_dccm.energy.energyToBraggAngle(energies, out=buffer)
+    assert thetas is buffer
+    np.testing.assert_allclose(thetas, fake_dccm.energy.energyToBraggAngle(energies))
+    energies_calc = fake_dccm.energy.braggAngleToEnergy(thetas, out=buffer)
+    assert energies_calc is buffer
+    np.testing.assert_allclose(energies_calc, energies)
+
+
+def test_zero_conversions():
+    assert isnan(energy_to_bragg_angle(0, CrystalIndex.Si111.value))
+    assert isnan(bragg_angle_to_energy(0, CrystalIndex.Si111.value))
+    # Arrays match the scalar results, without numpy warnings
+    values = np.array([0.0, 13.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        thetas = energy_to_bragg_angle(values, CrystalIndex.Si111.value)
+        energies = bragg_angle_to_energy(
+            np.array([0.0, thetas[1]]), CrystalIndex.Si111.value,
+        )
+    assert isnan(thetas[0]) and not isnan(thetas[1])
+    assert isnan(energies[0])
+    assert energies[1] == pytest.approx(13.0)